@@ -9,13 +9,18 @@ exceed a single context window.
 Key insight: Projects should continue from EXACT state, not re-plan from scratch.
 """
 
-import json
+import os
 import sys
 from datetime import datetime
 from pathlib import Path
 from dataclasses import dataclass, asdict
 from typing import Optional
 
+# Add parent to path for standalone script execution
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from orchestration.core.serialization import json_dumps, json_loads
+
 
 @dataclass
 class SessionState:
@@ -41,6 +46,22 @@ class SessionState:
     resume_instructions: str
 
 
+def _atomic_write(path: Path, payload: bytes):
+    """
+    Write payload to path via a temp file and os.replace, so a reader never
+    sees a partially written checkpoint.
+    """
+    tmp_path = path.with_name(path.name + ".tmp")
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(payload)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+    os.replace(tmp_path, path)
+
+
 class SessionContinuationManager:
     """
     Manages session state persistence and continuation.
@@ -119,12 +140,13 @@ class SessionContinuationManager:
         self.current_state = state
 
         # Save to file
+        payload = json_dumps(asdict(state))
         checkpoint_file = self.state_dir / f"checkpoint_{session_id}.json"
-        checkpoint_file.write_text(json.dumps(asdict(state), indent=2))
+        _atomic_write(checkpoint_file, payload)
 
         # Also save as "latest"
         latest_file = self.state_dir / "latest_checkpoint.json"
-        latest_file.write_text(json.dumps(asdict(state), indent=2))
+        _atomic_write(latest_file, payload)
 
         print(f"✓ Checkpoint saved: {checkpoint_file}")
 
@@ -202,7 +224,7 @@ class SessionContinuationManager:
             return None
 
         try:
-            data = json.loads(latest_file.read_text())
+            data = json_loads(latest_file.read_bytes())
             state = SessionState(**data)
             self.current_state = state
             return state
@@ -219,7 +241,7 @@ class SessionContinuationManager:
             return None
 
         try:
-            data = json.loads(checkpoint_file.read_text())
+            data = json_loads(checkpoint_file.read_bytes())
             state = SessionState(**data)
             self.current_state = state
             return state
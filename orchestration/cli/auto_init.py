@@ -4,7 +4,6 @@ Automatically initialize task queue from specification.
 Called by git hooks, not by model.
 No model decision required.
 """
-import json
 import sys
 import re
 from pathlib import Path
@@ -16,6 +15,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 # Import canonical spec discovery (single source of truth)
 from orchestration.cli.spec_discovery import discover_all_specs
 from orchestration.core.paths import DataPaths
+from orchestration.core.serialization import json_dumps, json_loads, yaml_loader
 
 # Global paths instance
 _paths = DataPaths()
@@ -57,12 +57,49 @@ def discover_specs() -> list[Path]:
     return discover_all_specs()
 
 
+def _read_yaml_features_block(spec_file: Path) -> bytes:
+    """
+    Read only the top-level ``features:`` block of a YAML spec.
+
+    Stops at the next top-level key, so the rest of a large spec is never
+    read or parsed. Returns b"" if there is no such block.
+    """
+    block = []
+    with open(spec_file, "rb") as f:
+        for line in f:
+            if block:
+                # Indented lines, comments, blanks and column-0 list items
+                # all still belong to the block
+                if line[:1] in (b" ", b"\t", b"#", b"\r", b"\n") or (
+                    line.startswith(b"-") and not line.startswith(b"---")
+                ):
+                    block.append(line)
+                    continue
+                break
+            if line.startswith(b"features:"):
+                block.append(line)
+    return b"".join(block)
+
+
 def extract_features_from_yaml(spec_file: Path) -> list[dict]:
     """Extract features from YAML spec."""
     try:
         import yaml
-        with open(spec_file) as f:
-            spec = yaml.safe_load(f)
+        loader = yaml_loader()
+
+        # Fast path: parse just the features block
+        spec = None
+        block = _read_yaml_features_block(spec_file)
+        if block:
+            try:
+                spec = yaml.load(block, Loader=loader)
+            except yaml.YAMLError:
+                spec = None
+
+        # Fall back to a full parse (anchors defined elsewhere, odd layouts)
+        if not isinstance(spec, dict) or not spec.get("features"):
+            with open(spec_file, "rb") as f:
+                spec = yaml.load(f, Loader=loader)
 
         if "features" not in spec:
             return []
@@ -276,7 +313,7 @@ def validate_yaml_spec(spec_file: Path) -> tuple[bool, str]:
         if not content.strip():
             return False, "File is empty"
 
-        spec = yaml.safe_load(content)
+        spec = yaml.load(content, Loader=yaml_loader())
 
         # Check 2: Root structure
         if not isinstance(spec, dict):
@@ -405,15 +442,17 @@ def save_extraction_metadata(spec_files: list[Path], features_by_file: dict[str,
         total_features: Total features extracted
         automated_success: Whether automated extraction found any features
     """
+    now = datetime.now().isoformat()
+
     metadata = {
-        "last_extraction": datetime.now().isoformat(),
+        "last_extraction": now,
         "extraction_method": "automated" if automated_success else "pending-llm",
         "spec_files": [
             {
                 "path": to_relative_path(f),
                 "features_extracted": features_by_file.get(str(f), 0),
                 "extraction_method": "automated" if features_by_file.get(str(f), 0) > 0 else "none",
-                "last_processed": datetime.now().isoformat()
+                "last_processed": now
             }
             for f in spec_files
         ],
@@ -429,7 +468,7 @@ def save_extraction_metadata(spec_files: list[Path], features_by_file: dict[str,
 
     metadata_file = _paths.extraction_metadata
     metadata_file.parent.mkdir(parents=True, exist_ok=True)
-    metadata_file.write_text(json.dumps(metadata, indent=2))
+    metadata_file.write_bytes(json_dumps(metadata))
 
 
 def auto_commit_extraction(extraction_type: str, features_added: int, features_total: int) -> bool:
@@ -621,11 +660,13 @@ def initialize_queue_from_multiple_specs(spec_files: list[Path]) -> bool:
     # Create tasks (may be empty if no features found)
     tasks = create_tasks_from_features(all_features)
 
+    now = datetime.now().isoformat()
+
     # Save to queue state
     queue_state = {
         "tasks": tasks,
         "completed_order": [],
-        "last_updated": datetime.now().isoformat(),
+        "last_updated": now,
         "initialized": True,
         "spec_file": to_relative_path(spec_files[0]),  # Backwards compatibility
         "spec_files": [to_relative_path(f) for f in spec_files],  # Multiple specs
@@ -634,7 +675,7 @@ def initialize_queue_from_multiple_specs(spec_files: list[Path]) -> bool:
 
     queue_file = _paths.queue_state
     queue_file.parent.mkdir(parents=True, exist_ok=True)
-    queue_file.write_text(json.dumps(queue_state, indent=2))
+    queue_file.write_bytes(json_dumps(queue_state))
 
     print(f"Initialized queue with {len(tasks)} tasks")
 
@@ -642,17 +683,17 @@ def initialize_queue_from_multiple_specs(spec_files: list[Path]) -> bool:
     manifest_file = _paths.spec_manifest
     manifest_file.parent.mkdir(parents=True, exist_ok=True)
     if manifest_file.exists():
-        manifest = json.loads(manifest_file.read_text())
+        manifest = json_loads(manifest_file.read_bytes())
     else:
         manifest = {}
 
     manifest["queue_initialized"] = True
     manifest["spec_file"] = to_relative_path(spec_files[0])  # Backwards compatibility
     manifest["spec_files"] = [to_relative_path(f) for f in spec_files]  # Multiple specs
-    manifest["last_sync"] = datetime.now().isoformat()
+    manifest["last_sync"] = now
     manifest["task_count"] = len(tasks)
 
-    manifest_file.write_text(json.dumps(manifest, indent=2))
+    manifest_file.write_bytes(json_dumps(manifest))
 
     # Save extraction metadata (pass automated_success flag)
     save_extraction_metadata(spec_files, features_by_file, len(all_features), automated_success)
@@ -719,11 +760,13 @@ def initialize_queue_from_spec(spec_file: Path) -> bool:
     # Create tasks
     tasks = create_tasks_from_features(features)
 
+    now = datetime.now().isoformat()
+
     # Save to queue state
     queue_state = {
         "tasks": tasks,
         "completed_order": [],
-        "last_updated": datetime.now().isoformat(),
+        "last_updated": now,
         "initialized": True,
         "spec_file": to_relative_path(spec_file),
         "total_features": len(features)
@@ -731,7 +774,7 @@ def initialize_queue_from_spec(spec_file: Path) -> bool:
 
     queue_file = _paths.queue_state
     queue_file.parent.mkdir(parents=True, exist_ok=True)
-    queue_file.write_text(json.dumps(queue_state, indent=2))
+    queue_file.write_bytes(json_dumps(queue_state))
 
     print(f"Initialized queue with {len(tasks)} tasks from {spec_file.name}")
 
@@ -739,16 +782,16 @@ def initialize_queue_from_spec(spec_file: Path) -> bool:
     manifest_file = _paths.spec_manifest
     manifest_file.parent.mkdir(parents=True, exist_ok=True)
     if manifest_file.exists():
-        manifest = json.loads(manifest_file.read_text())
+        manifest = json_loads(manifest_file.read_bytes())
     else:
         manifest = {}
 
     manifest["queue_initialized"] = True
     manifest["spec_file"] = to_relative_path(spec_file)
-    manifest["last_sync"] = datetime.now().isoformat()
+    manifest["last_sync"] = now
     manifest["task_count"] = len(tasks)
 
-    manifest_file.write_text(json.dumps(manifest, indent=2))
+    manifest_file.write_bytes(json_dumps(manifest))
 
     return True
 
@@ -764,7 +807,7 @@ def auto_initialize():
     queue_file = _paths.queue_state
     if queue_file.exists():
         try:
-            state = json.loads(queue_file.read_text())
+            state = json_loads(queue_file.read_bytes())
             if state.get("initialized") and state.get("tasks"):
                 print("Queue already initialized")
                 print(f"  Tasks: {len(state['tasks'])}")
@@ -779,7 +822,7 @@ def auto_initialize():
     spec_files = []
 
     if manifest_file.exists():
-        manifest = json.loads(manifest_file.read_text())
+        manifest = json_loads(manifest_file.read_bytes())
         # Check for spec_files (plural) first, then fallback to spec_file (backwards compat)
         if manifest.get("spec_files"):
             spec_files = [Path(f) for f in manifest["spec_files"] if Path(f).exists()]
@@ -833,7 +876,7 @@ def force_reinit() -> bool:
     queue_file = _paths.queue_state
     if queue_file.exists():
         try:
-            state = json.loads(queue_file.read_text())
+            state = json_loads(queue_file.read_bytes())
             task_count = len(state.get("tasks", []))
             completed = sum(1 for t in state.get("tasks", []) if t.get("status") == "completed")
             print(f"Current queue: {task_count} tasks ({completed} completed)")
@@ -888,7 +931,7 @@ def update_queue_from_specs() -> bool:
 
     # Load existing queue
     try:
-        existing_state = json.loads(queue_file.read_text())
+        existing_state = json_loads(queue_file.read_bytes())
         existing_tasks = {t["feature_id"]: t for t in existing_state.get("tasks", [])}
         print(f"Existing queue: {len(existing_tasks)} tasks")
         completed = sum(1 for t in existing_tasks.values() if t.get("status") == "completed")
@@ -903,7 +946,7 @@ def update_queue_from_specs() -> bool:
     spec_files = []
 
     if manifest_file.exists():
-        manifest = json.loads(manifest_file.read_text())
+        manifest = json_loads(manifest_file.read_bytes())
         if manifest.get("spec_files"):
             spec_files = [Path(f) for f in manifest["spec_files"] if Path(f).exists()]
         elif manifest.get("spec_file"):
@@ -1021,32 +1064,34 @@ def update_queue_from_specs() -> bool:
     print(f"  Preserved tasks: {preserved}")
     print("")
 
+    now = datetime.now().isoformat()
+
     # Save updated queue
     queue_state = {
         "tasks": updated_tasks,
         "completed_order": existing_state.get("completed_order", []),
-        "last_updated": datetime.now().isoformat(),
+        "last_updated": now,
         "initialized": True,
         "spec_file": to_relative_path(spec_files[0]),  # Backwards compatibility
         "spec_files": [to_relative_path(f) for f in spec_files],
         "total_features": len(all_features)
     }
 
-    queue_file.write_text(json.dumps(queue_state, indent=2))
+    queue_file.write_bytes(json_dumps(queue_state))
 
     # Update manifest
     if manifest_file.exists():
-        manifest = json.loads(manifest_file.read_text())
+        manifest = json_loads(manifest_file.read_bytes())
     else:
         manifest = {}
 
     manifest["queue_initialized"] = True
     manifest["spec_file"] = to_relative_path(spec_files[0])
     manifest["spec_files"] = [to_relative_path(f) for f in spec_files]
-    manifest["last_sync"] = datetime.now().isoformat()
+    manifest["last_sync"] = now
     manifest["task_count"] = len(updated_tasks)
 
-    manifest_file.write_text(json.dumps(manifest, indent=2))
+    manifest_file.write_bytes(json_dumps(manifest))
 
     # Save extraction metadata (pass automated_success flag)
     save_extraction_metadata(spec_files, features_by_file, len(all_features), automated_success)
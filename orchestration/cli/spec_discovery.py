@@ -15,6 +15,7 @@ Supported extensions:
 - .yaml, .yml (YAML)
 - .json (JSON)
 """
+import os
 import re
 import json
 import sys
@@ -33,6 +34,26 @@ SPEC_DIRECTORIES = ["specifications", "specs"]
 DOCS_SPEC_PATTERN = re.compile(r".*[-_]spec(ification)?s?\.md$", re.IGNORECASE)
 
 
+def _iter_spec_files(directory: str):
+    """
+    Recursively yield paths of files with supported spec extensions.
+
+    Uses one os.scandir per directory; DirEntry caches file type, so no
+    extra stat() is needed per entry.
+    """
+    try:
+        with os.scandir(directory) as it:
+            entries = list(it)
+    except OSError:
+        return
+
+    for entry in entries:
+        if entry.is_dir(follow_symlinks=False):
+            yield from _iter_spec_files(entry.path)
+        elif entry.is_file() and os.path.splitext(entry.name)[1].lower() in SPEC_EXTENSIONS:
+            yield entry.path
+
+
 def discover_all_specs(project_root: Optional[Path] = None) -> list[Path]:
     """
     Discover ALL specification files in standard locations.
@@ -57,18 +78,17 @@ def discover_all_specs(project_root: Optional[Path] = None) -> list[Path]:
 
     # 1. Search spec directories exhaustively (recursive)
     for dir_name in SPEC_DIRECTORIES:
-        spec_dir = project_root / dir_name
-        if spec_dir.exists() and spec_dir.is_dir():
-            for file_path in spec_dir.rglob("*"):
-                if file_path.is_file() and file_path.suffix.lower() in SPEC_EXTENSIONS:
-                    discovered.append(file_path)
+        for file_path in _iter_spec_files(os.path.join(project_root, dir_name)):
+            discovered.append(Path(file_path))
 
     # 2. Search docs/ directory with pattern matching (non-recursive)
-    docs_dir = project_root / "docs"
-    if docs_dir.exists() and docs_dir.is_dir():
-        for file_path in docs_dir.iterdir():
-            if file_path.is_file() and DOCS_SPEC_PATTERN.match(file_path.name):
-                discovered.append(file_path)
+    try:
+        with os.scandir(project_root / "docs") as it:
+            for entry in it:
+                if entry.is_file() and DOCS_SPEC_PATTERN.match(entry.name):
+                    discovered.append(Path(entry.path))
+    except OSError:
+        pass
 
     # Return sorted unique paths
     return sorted(set(discovered))
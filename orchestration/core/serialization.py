@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+Shared Serialization Helpers for Orchestration System
+
+Single home for the fast-path serializers used across orchestration, so
+optional accelerated backends are detected in one place.
+
+JSON uses orjson when installed and falls back to the standard library.
+Both paths write 2-space indented output and accept non-string dict keys
+(e.g. int), which are written as strings, as json.dumps does.
+
+YAML uses libyaml's C safe loader/dumper when PyYAML was built with it and
+the pure-Python safe classes otherwise. PyYAML is imported on first use,
+so importing this module does not pull it in.
+
+Usage:
+    from orchestration.core.serialization import json_dumps, json_loads
+    from orchestration.core.serialization import yaml_loader, yaml_dumper
+
+    path.write_bytes(json_dumps(state))
+    state = json_loads(path.read_bytes())
+
+    with open(path, 'rb') as f:
+        data = yaml.load(f, Loader=yaml_loader())
+    text = yaml.dump(data, Dumper=yaml_dumper())
+"""
+
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def json_dumps(obj) -> bytes:
+    """Serialize to 2-space indented JSON bytes, using orjson when installed."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, indent=2).encode()
+
+
+def json_loads(data: bytes):
+    """Parse JSON bytes, using orjson when installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def yaml_loader():
+    """Return libyaml's C safe loader when available, else the pure-Python one."""
+    import yaml
+    return getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def yaml_dumper():
+    """Return libyaml's C safe dumper when available, else the pure-Python one."""
+    import yaml
+    return getattr(yaml, "CSafeDumper", yaml.SafeDumper)
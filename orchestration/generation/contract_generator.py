@@ -15,12 +15,15 @@ This module provides:
 from pathlib import Path
 from typing import List, Dict, Optional, Any, Tuple
 from dataclasses import dataclass, asdict, field
-import yaml
-import json
 import re
 import sys
 from enum import Enum
 
+# Add parent to path for standalone script execution
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from orchestration.core.serialization import yaml_dumper, yaml_loader
+
 
 class HTTPMethod(Enum):
     """HTTP methods."""
@@ -33,6 +36,27 @@ class HTTPMethod(Enum):
     OPTIONS = "options"
 
 
+# Path template parameters, e.g. {id} in /users/{id}
+PATH_PARAM_RE = re.compile(r'\{(\w+)\}')
+
+# Standard descriptions for response status codes
+STATUS_DESCRIPTIONS = {
+    200: 'Successful operation',
+    201: 'Resource created successfully',
+    204: 'No content',
+    400: 'Bad request',
+    401: 'Unauthorized',
+    403: 'Forbidden',
+    404: 'Resource not found',
+    409: 'Conflict',
+    422: 'Validation error',
+    429: 'Too many requests',
+    500: 'Internal server error',
+    503: 'Service unavailable',
+    504: 'Gateway timeout'
+}
+
+
 @dataclass
 class ErrorScenario:
     """Error scenario for an endpoint."""
@@ -152,7 +176,7 @@ class Endpoint:
     def _generate_path_parameters(self) -> List[Dict[str, Any]]:
         """Generate path parameters."""
         params = []
-        for match in re.finditer(r'\{(\w+)\}', self.path):
+        for match in PATH_PARAM_RE.finditer(self.path):
             param_name = match.group(1)
             params.append({
                 'name': param_name,
@@ -221,22 +245,7 @@ class Endpoint:
 
     def _get_status_description(self, status_code: int) -> str:
         """Get standard description for status code."""
-        descriptions = {
-            200: 'Successful operation',
-            201: 'Resource created successfully',
-            204: 'No content',
-            400: 'Bad request',
-            401: 'Unauthorized',
-            403: 'Forbidden',
-            404: 'Resource not found',
-            409: 'Conflict',
-            422: 'Validation error',
-            429: 'Too many requests',
-            500: 'Internal server error',
-            503: 'Service unavailable',
-            504: 'Gateway timeout'
-        }
-        return descriptions.get(status_code, f'Status {status_code}')
+        return STATUS_DESCRIPTIONS.get(status_code, f'Status {status_code}')
 
 
 @dataclass
@@ -250,6 +259,8 @@ class Contract:
 
     def to_openapi_yaml(self) -> str:
         """Convert to OpenAPI 3.0 YAML."""
+        import yaml
+
         openapi_dict = {
             'openapi': self.openapi_version,
             'info': self.info,
@@ -266,7 +277,7 @@ class Contract:
             }
         }
 
-        return yaml.dump(openapi_dict, default_flow_style=False, sort_keys=False)
+        return yaml.dump(openapi_dict, Dumper=yaml_dumper(), default_flow_style=False, sort_keys=False)
 
     def _generate_paths(self) -> Dict[str, Dict[str, Any]]:
         """Generate paths object."""
@@ -335,6 +346,16 @@ class Contract:
 class ContractGenerator:
     """Generates contracts from specifications."""
 
+    # Specification patterns, compiled once for every generator
+    ENDPOINT_RE = re.compile(r'(GET|POST|PUT|DELETE|PATCH)\s+(/[\w/{}:\-]+)', re.IGNORECASE)
+    RESOURCE_RE = re.compile(r'\b(\w+)\s+(?:resource|API|endpoint|service)\b', re.IGNORECASE)
+    SENTENCE_SPLIT_RE = re.compile(r'[.!?]\s+')
+    FIELD_RE = re.compile(r'(\w+)\s*\((\w+)\)')
+    RATE_RE = re.compile(r'(\d+)\s+requests?\s+per\s+(\w+)', re.IGNORECASE)
+    TIMEOUT_RE = re.compile(r'timeout[:\s]+(\d+)', re.IGNORECASE)
+    SCHEMA_RE = re.compile(r'(?:schema|model):\s*(\w+)\s*\{([^}]+)\}', re.IGNORECASE)
+    SCHEMA_FIELD_RE = re.compile(r'(\w+)\s*:\s*(\w+)')
+
     def __init__(self, project_root: Path):
         self.project_root = Path(project_root)
         self.contracts_dir = self.project_root / "contracts"
@@ -389,9 +410,7 @@ class ContractGenerator:
         endpoints = []
 
         # Pattern matching for API endpoints
-        endpoint_pattern = r'(GET|POST|PUT|DELETE|PATCH)\s+(/[\w/{}:\-]+)'
-
-        for match in re.finditer(endpoint_pattern, spec_text, re.IGNORECASE):
+        for match in self.ENDPOINT_RE.finditer(spec_text):
             method = match.group(1).upper()
             path = match.group(2)
 
@@ -426,10 +445,9 @@ class ContractGenerator:
         endpoints = []
 
         # Look for resource mentions like "user resource", "product API"
-        resource_pattern = r'\b(\w+)\s+(?:resource|API|endpoint|service)\b'
         resources = set()
 
-        for match in re.finditer(resource_pattern, spec_text, re.IGNORECASE):
+        for match in self.RESOURCE_RE.finditer(spec_text):
             resources.add(match.group(1).lower())
 
         # Generate standard CRUD for each resource
@@ -570,7 +588,7 @@ class ContractGenerator:
     def _extract_summary(self, context: str, path: str, method: str) -> str:
         """Extract endpoint summary from context."""
         # Look for sentences containing the endpoint
-        sentences = re.split(r'[.!?]\s+', context)
+        sentences = self.SENTENCE_SPLIT_RE.split(context)
         for sentence in sentences:
             if path in sentence or method.lower() in sentence.lower():
                 return sentence.strip()
@@ -581,11 +599,9 @@ class ContractGenerator:
 
     def _extract_description(self, context: str) -> str:
         """Extract detailed description from context."""
-        # Take first paragraph or sentence
-        paragraphs = context.split('\n\n')
-        if paragraphs:
-            return paragraphs[0].strip()
-        return ""
+        # Take first paragraph; only that one is split off, so a whole
+        # specification is not broken into paragraphs just to read the first
+        return context.split('\n\n', 1)[0].strip()
 
     def _extract_request_schema(self, context: str, method: str) -> Optional[Dict]:
         """Extract request schema from context."""
@@ -596,8 +612,7 @@ class ContractGenerator:
         fields = {}
 
         # Pattern: "field_name (type)"
-        field_pattern = r'(\w+)\s*\((\w+)\)'
-        for match in re.finditer(field_pattern, context):
+        for match in self.FIELD_RE.finditer(context):
             field_name = match.group(1)
             field_type = match.group(2).lower()
 
@@ -653,21 +668,22 @@ class ContractGenerator:
     def _extract_validation_rules(self, context: str) -> List[ValidationRule]:
         """Extract validation rules from context."""
         rules = []
+        context_lower = context.lower()
 
         # Look for validation keywords
-        if 'required' in context.lower():
+        if 'required' in context_lower:
             rules.append(ValidationRule(
                 field='*',
                 rules=['required']
             ))
 
-        if 'email' in context.lower():
+        if 'email' in context_lower:
             rules.append(ValidationRule(
                 field='email',
                 rules=['email', 'required']
             ))
 
-        if 'password' in context.lower():
+        if 'password' in context_lower:
             rules.append(ValidationRule(
                 field='password',
                 rules=['min:8', 'required']
@@ -678,8 +694,7 @@ class ContractGenerator:
     def _determine_rate_limit(self, path: str, method: str, context: str) -> Optional[RateLimit]:
         """Determine rate limit for endpoint."""
         # Check for rate limit mentions in context
-        rate_pattern = r'(\d+)\s+requests?\s+per\s+(\w+)'
-        match = re.search(rate_pattern, context, re.IGNORECASE)
+        match = self.RATE_RE.search(context)
 
         if match:
             max_requests = int(match.group(1))
@@ -705,8 +720,7 @@ class ContractGenerator:
 
     def _extract_timeout(self, context: str) -> int:
         """Extract timeout from context."""
-        timeout_pattern = r'timeout[:\s]+(\d+)'
-        match = re.search(timeout_pattern, context, re.IGNORECASE)
+        match = self.TIMEOUT_RE.search(context)
 
         if match:
             return int(match.group(1))
@@ -717,9 +731,10 @@ class ContractGenerator:
         """Determine if endpoint requires authentication."""
         # Look for auth-related keywords
         no_auth_keywords = ['public', 'no auth', 'unauthenticated', 'anonymous']
+        context_lower = context.lower()
 
         for keyword in no_auth_keywords:
-            if keyword in context.lower():
+            if keyword in context_lower:
                 return False
 
         return True  # Default to requiring auth
@@ -737,14 +752,12 @@ class ContractGenerator:
 
         # Extract schema definitions from spec
         # Look for "schema:" or "model:" sections
-        schema_pattern = r'(?:schema|model):\s*(\w+)\s*\{([^}]+)\}'
-
-        for match in re.finditer(schema_pattern, spec_text, re.IGNORECASE):
+        for match in self.SCHEMA_RE.finditer(spec_text):
             schema_name = match.group(1)
             fields_text = match.group(2)
 
             properties = {}
-            for field_match in re.finditer(r'(\w+)\s*:\s*(\w+)', fields_text):
+            for field_match in self.SCHEMA_FIELD_RE.finditer(fields_text):
                 field_name = field_match.group(1)
                 field_type = field_match.group(2).lower()
 
@@ -769,22 +782,23 @@ class ContractGenerator:
     def _determine_security_schemes(self, spec_text: str) -> Dict[str, Dict]:
         """Determine security schemes from specification."""
         schemes = {}
+        spec_lower = spec_text.lower()
 
-        if 'jwt' in spec_text.lower() or 'bearer' in spec_text.lower():
+        if 'jwt' in spec_lower or 'bearer' in spec_lower:
             schemes['bearerAuth'] = {
                 'type': 'http',
                 'scheme': 'bearer',
                 'bearerFormat': 'JWT'
             }
 
-        if 'api key' in spec_text.lower() or 'apikey' in spec_text.lower():
+        if 'api key' in spec_lower or 'apikey' in spec_lower:
             schemes['apiKey'] = {
                 'type': 'apiKey',
                 'in': 'header',
                 'name': 'X-API-Key'
             }
 
-        if 'oauth' in spec_text.lower():
+        if 'oauth' in spec_lower:
             schemes['oauth2'] = {
                 'type': 'oauth2',
                 'flows': {
@@ -876,28 +890,29 @@ def api_client():
                 paths[endpoint.path] = []
             paths[endpoint.path].append(endpoint)
 
-        # Generate test class for each path
+        # Generate test class for each path; pieces are joined once at the end
+        parts = [test_code]
         for path, endpoints in paths.items():
             class_name = self._path_to_class_name(path)
-            test_code += f'\nclass Test{class_name}:\n'
-            test_code += f'    """Tests for {path}"""\n\n'
+            parts.append(f'\nclass Test{class_name}:\n')
+            parts.append(f'    """Tests for {path}"""\n\n')
 
             for endpoint in endpoints:
                 # Generate happy path test
-                test_code += self._generate_happy_path_test(endpoint)
-                test_code += '\n'
+                parts.append(self._generate_happy_path_test(endpoint))
+                parts.append('\n')
 
                 # Generate error scenario tests
                 for scenario in endpoint.error_scenarios:
-                    test_code += self._generate_error_test(endpoint, scenario)
-                    test_code += '\n'
+                    parts.append(self._generate_error_test(endpoint, scenario))
+                    parts.append('\n')
 
                 # Generate validation tests
                 if endpoint.validation_rules:
-                    test_code += self._generate_validation_test(endpoint)
-                    test_code += '\n'
+                    parts.append(self._generate_validation_test(endpoint))
+                    parts.append('\n')
 
-        return test_code
+        return ''.join(parts)
 
     def _path_to_class_name(self, path: str) -> str:
         """Convert path to class name."""
@@ -920,7 +935,7 @@ def api_client():
 
         # Generate path with example values
         test_path = endpoint.path
-        path_params = re.findall(r'\{(\w+)\}', test_path)
+        path_params = PATH_PARAM_RE.findall(test_path)
         for param in path_params:
             test_path = test_path.replace(f'{{{param}}}', f'{{test_{param}}}')
             request_data += f'\n        test_{param} = "test-id-123"'
@@ -1076,7 +1091,9 @@ def main():
             sys.exit(1)
 
         # Load contract and generate tests
-        contract_data = yaml.safe_load(contract_file.read_text())
+        import yaml
+        with open(contract_file, 'rb') as f:
+            contract_data = yaml.load(f, Loader=yaml_loader())
         component_name = contract_data['info']['title'].split()[0].lower()
 
         # TODO: Parse contract back into Contract object
@@ -34,7 +34,7 @@ def load_spec_manifest() -> dict:
     """Load spec manifest."""
     manifest_file = _paths.spec_manifest
     if manifest_file.exists():
-        return json.loads(manifest_file.read_text())
+        return json.loads(manifest_file.read_bytes())
     return {"spec_file": None, "queue_initialized": False}
 
 
@@ -43,7 +43,7 @@ def load_queue_state() -> dict:
     queue_file = _paths.queue_state
     if queue_file.exists():
         try:
-            return json.loads(queue_file.read_text())
+            return json.loads(queue_file.read_bytes())
         except json.JSONDecodeError:
             return {"tasks": [], "initialized": False}
     return {"tasks": [], "initialized": False}
@@ -124,8 +124,8 @@ def auto_initialize_queue():
             # Update manifest
             manifest["queue_initialized"] = True
             manifest["last_sync"] = datetime.now().isoformat()
-            _paths.spec_manifest.write_text(
-                json.dumps(manifest, indent=2)
+            _paths.spec_manifest.write_bytes(
+                json.dumps(manifest, indent=2).encode()
             )
             print("  Auto-initialized task queue from spec")
             return True
@@ -33,7 +33,7 @@ def load_queue_state() -> dict:
     queue_file = _paths.queue_state
     if queue_file.exists():
         try:
-            return json.loads(queue_file.read_text())
+            return json.loads(queue_file.read_bytes())
         except json.JSONDecodeError:
             return {"tasks": []}
     return {"tasks": []}
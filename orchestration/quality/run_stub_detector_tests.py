@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+"""
+Simple test runner for stub_detector without pytest dependency.
+Pins the scan's skip rules, README head limit, result caching and the
+yes/no and parallel entry points.
+"""
+
+import os
+import subprocess
+import sys
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+# Add orchestration to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from orchestration.verification.quality import stub_detector
+from orchestration.verification.quality.stub_detector import (
+    MAX_SCAN_BYTES,
+    PARALLEL_SCAN_THRESHOLD,
+    README_SCAN_LIMIT,
+    has_stubs,
+    scan_for_stubs,
+)
+
+STUB_PY = b"def login():\n    raise NotImplementedError\n"
+CLEAN_PY = b"def login():\n    return True\n"
+PENDING_README = b"# Auth\n\nImplementation pending.\n"
+
+
+def _write(root, rel_path, data):
+    """Write bytes to root/rel_path, creating parent directories as needed."""
+    path = Path(root) / rel_path
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(data)
+    return path
+
+
+def _found(root):
+    """Stub files under root, as sorted paths relative to it."""
+    return sorted(os.path.relpath(p, root) for p in scan_for_stubs(Path(root)))
+
+
+# Test 1: Source files and READMEs are detected
+def test_detects_stubs():
+    """Stub markers in Python, Rust and README files are reported."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        _write(tmpdir, "a/main.py", STUB_PY)
+        _write(tmpdir, "b/lib.rs", b"fn run() { todo!() }\n")
+        _write(tmpdir, "c/README.md", PENDING_README)
+        _write(tmpdir, "d/clean.py", CLEAN_PY)
+        _write(tmpdir, "e/notes.txt", b"TODO: implement\n")
+
+        assert _found(tmpdir) == ["a/main.py", "b/lib.rs", "c/README.md"], _found(tmpdir)
+
+    print("✓ test_detects_stubs")
+
+
+# Test 2: Skipped directories
+def test_skip_dirs():
+    """Files under SKIP_DIRS, including node_modules READMEs, are not scanned."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        _write(tmpdir, "node_modules/pkg/README.md", PENDING_README)
+        _write(tmpdir, "node_modules/pkg/index.py", STUB_PY)
+        _write(tmpdir, ".venv/lib/site.py", STUB_PY)
+        _write(tmpdir, "src/__pycache__/mod.py", STUB_PY)
+
+        assert _found(tmpdir) == [], _found(tmpdir)
+        assert not has_stubs(Path(tmpdir)), "has_stubs looked inside a skipped directory"
+
+    print("✓ test_skip_dirs")
+
+
+# Test 3: README head limit
+def test_readme_scan_limit():
+    """Only the first README_SCAN_LIMIT bytes of a README are searched."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        filler = b"x" * README_SCAN_LIMIT + b"\n"
+        _write(tmpdir, "late/README.md", b"# Late\n" + filler + b"Implementation pending.\n")
+        _write(tmpdir, "early/README.md", PENDING_README + filler)
+
+        assert _found(tmpdir) == ["early/README.md"], _found(tmpdir)
+
+    print("✓ test_readme_scan_limit")
+
+
+# Test 4: Encodings and skipped file kinds
+def test_file_filters():
+    """Non-UTF-8 files are scanned; binary, oversized and minified files are not."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        _write(tmpdir, "latin1.py", b"# caf\xe9\nraise NotImplementedError\n")
+        _write(tmpdir, "binary.py", b"\x00\x01" + STUB_PY)
+        _write(tmpdir, "oversized.py", STUB_PY + b"#" * MAX_SCAN_BYTES)
+        _write(tmpdir, "minified.py", STUB_PY.replace(b"\n", b";") + b"x" * 50_000)
+
+        assert _found(tmpdir) == ["latin1.py"], _found(tmpdir)
+
+    print("✓ test_file_filters")
+
+
+# Test 5: Result cache
+def test_cache_invalidation():
+    """Unchanged files reuse cached results; edited files are rescanned."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = _write(tmpdir, "main.py", CLEAN_PY)
+        assert _found(tmpdir) == [], "Clean file reported"
+
+        hits = stub_detector._cached_file_has_stub.cache_info().hits
+        assert _found(tmpdir) == [], "Clean file reported on rescan"
+        assert stub_detector._cached_file_has_stub.cache_info().hits > hits, "Unchanged file not cached"
+
+        # Same size, so only the mtime tells the cache the file changed
+        same_size_stub = CLEAN_PY.replace(b"return True", b"todo!()    ")
+        assert len(same_size_stub) == len(CLEAN_PY)
+        path.write_bytes(same_size_stub)
+        st = path.stat()
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+        assert _found(tmpdir) == ["main.py"], "Same-size edit adding a stub not picked up"
+
+        path.write_bytes(STUB_PY)
+        assert _found(tmpdir) == ["main.py"], "Stub file not reported after resize"
+
+        path.write_bytes(CLEAN_PY)
+        assert _found(tmpdir) == [], "Edit removing a stub not picked up"
+
+    print("✓ test_cache_invalidation")
+
+
+# Test 6: has_stubs agrees with scan_for_stubs
+def test_has_stubs():
+    """has_stubs() answers whether scan_for_stubs() would find anything."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        _write(tmpdir, "a/clean.py", CLEAN_PY)
+        assert not has_stubs(Path(tmpdir)), "False positive"
+
+        _write(tmpdir, "b/main.py", STUB_PY)
+        assert has_stubs(Path(tmpdir)), "Stub not found"
+
+    print("✓ test_has_stubs")
+
+
+# Test 7: Executor path
+def test_executor_matches_serial():
+    """Large trees scanned with an executor give the same result as in-process."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        for i in range(PARALLEL_SCAN_THRESHOLD):
+            _write(tmpdir, f"pkg{i % 8}/mod{i}.py", STUB_PY if i % 50 == 0 else CLEAN_PY)
+
+        serial = scan_for_stubs(Path(tmpdir))
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            parallel = scan_for_stubs(Path(tmpdir), executor=executor)
+
+        assert len(serial) == 6, f"Expected 6 stub files, got {len(serial)}"
+        assert parallel == serial, "Executor result differs from in-process scan"
+
+    print("✓ test_executor_matches_serial")
+
+
+# Test 8: --check CLI mode
+def test_check_cli():
+    """--check exits 1 when a stub exists and 0 otherwise."""
+    script = stub_detector.__file__
+    with tempfile.TemporaryDirectory() as tmpdir:
+        _write(tmpdir, "a/clean.py", CLEAN_PY)
+        clean = subprocess.run([sys.executable, script, "--check", tmpdir], capture_output=True)
+        assert clean.returncode == 0, f"Clean tree exited {clean.returncode}"
+
+        _write(tmpdir, "b/main.py", STUB_PY)
+        stubbed = subprocess.run([sys.executable, script, "--check", tmpdir], capture_output=True)
+        assert stubbed.returncode == 1, f"Stubbed tree exited {stubbed.returncode}"
+
+    print("✓ test_check_cli")
+
+
+def run_all_tests():
+    """Run all tests."""
+    tests = [
+        test_detects_stubs,
+        test_skip_dirs,
+        test_readme_scan_limit,
+        test_file_filters,
+        test_cache_invalidation,
+        test_has_stubs,
+        test_executor_matches_serial,
+        test_check_cli,
+    ]
+
+    print("=== Running Stub Detector Tests ===\n")
+
+    errors = []
+    for test in tests:
+        try:
+            test()
+        except Exception as e:
+            errors.append(f"{test.__name__}: {e}")
+            print(f"✗ {test.__name__}: {e}")
+
+    passed = len(tests) - len(errors)
+    print("\n=== Test Results ===")
+    print(f"Passed: {passed}/{len(tests)}")
+    print(f"Failed: {len(errors)}/{len(tests)}")
+
+    if not errors:
+        print("\n✓ All tests passed!")
+        return 0
+    else:
+        print("\n✗ Some tests failed:")
+        for error in errors:
+            print(f"  - {error}")
+        return 1
+
+
+if __name__ == '__main__':
+    sys.exit(run_all_tests())
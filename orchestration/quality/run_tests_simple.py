@@ -4,8 +4,11 @@ Simple test runner without pytest dependency.
 Tests core functionality of requirements_tracker.
 """
 
+import os
 import sys
 import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
 from pathlib import Path
 
 # Add orchestration to path
@@ -19,6 +22,98 @@ from requirements_tracker import (
     RequirementsTracker
 )
 
+# Keep the many small fixture writes in memory (tmpfs) on Linux; set
+# REQUIREMENTS_TRACKER_TESTS_ON_DISK=1 to exercise the real disk instead.
+# None means the platform default temp directory.
+TMP_BASE = None
+if (sys.platform.startswith("linux") and os.access("/dev/shm", os.W_OK)
+        and os.environ.get("REQUIREMENTS_TRACKER_TESTS_ON_DISK") != "1"):
+    TMP_BASE = "/dev/shm"
+
+# Fixture file contents, encoded once
+SPEC_MD = b"""
+# Requirements
+
+REQ-001: User MUST be able to login with email and password.
+
+The system SHALL validate credentials.
+
+User story: As a user, I want to reset my password.
+
+The system SHOULD accept credit cards.
+
+Payment MAY be processed async.
+"""
+
+AUTH_PY = b"""
+# @implements: REQ-001
+def authenticate_user(email, password):
+    # REQ-002: Validate credentials
+    return True
+
+# Implements REQ-003
+def send_email():
+    pass
+"""
+
+TEST_AUTH_PY = b"""
+# @validates: REQ-001
+def test_login():
+    assert True
+
+# Tests REQ-002
+def test_password():
+    assert True
+
+def test_req_003_feature():
+    assert True
+"""
+
+# Shared temp root for the whole run, set in each worker by run_all_tests()
+_TMP_ROOT = None
+
+def _init_worker(tmp_root):
+    """Process pool initializer: share one temp root across all tests."""
+    global _TMP_ROOT
+    _TMP_ROOT = tmp_root
+
+@contextmanager
+def _test_dir():
+    """
+    Yield a fresh directory for one test.
+
+    Under run_all_tests() this is a subdirectory of the shared run root,
+    which is removed once at the end rather than after every test.
+    """
+    if _TMP_ROOT is None:
+        with tempfile.TemporaryDirectory(dir=TMP_BASE) as tmpdir:
+            yield tmpdir
+    else:
+        yield tempfile.mkdtemp(dir=_TMP_ROOT)
+
+def _materialize(root, tree):
+    """
+    Create a directory tree in one pass.
+
+    tree maps names to file contents (bytes) or nested dicts (subdirectories).
+    Each directory is created once, parents first, then all files are written.
+    """
+    dirs = set()
+    files = []
+    stack = [(Path(root), tree)]
+    while stack:
+        base, node = stack.pop()
+        dirs.add(base)
+        for name, value in node.items():
+            if isinstance(value, dict):
+                stack.append((base / name, value))
+            else:
+                files.append((base / name, value))
+    for directory in sorted(dirs, key=lambda d: len(d.parts)):
+        os.makedirs(directory, exist_ok=True)
+    for path, content in files:
+        path.write_bytes(content)
+
 def test_requirement_serialization():
     """Test Requirement serialization/deserialization."""
     req = Requirement(
@@ -81,26 +176,12 @@ def test_requirement_trace():
 
 def test_parse_requirements():
     """Test requirement parsing."""
-    with tempfile.TemporaryDirectory() as tmpdir:
+    with _test_dir() as tmpdir:
         project_root = Path(tmpdir)
-        (project_root / "orchestration").mkdir()
 
         # Create spec file
-        spec_content = """
-# Requirements
-
-REQ-001: User MUST be able to login with email and password.
-
-The system SHALL validate credentials.
-
-User story: As a user, I want to reset my password.
-
-The system SHOULD accept credit cards.
-
-Payment MAY be processed async.
-"""
+        _materialize(project_root, {"orchestration": {}, "spec.md": SPEC_MD})
         spec_file = project_root / "spec.md"
-        spec_file.write_text(spec_content)
 
         tracker = RequirementsTracker(project_root)
         requirements = tracker.parse_requirements(spec_file)
@@ -125,25 +206,14 @@ Payment MAY be processed async.
 
 def test_scan_implementation():
     """Test implementation scanning."""
-    with tempfile.TemporaryDirectory() as tmpdir:
+    with _test_dir() as tmpdir:
         project_root = Path(tmpdir)
-        (project_root / "orchestration").mkdir()
 
         # Create implementation file
-        impl_content = """
-# @implements: REQ-001
-def authenticate_user(email, password):
-    # REQ-002: Validate credentials
-    return True
-
-# Implements REQ-003
-def send_email():
-    pass
-"""
-        impl_dir = project_root / "src"
-        impl_dir.mkdir()
-        impl_file = impl_dir / "auth.py"
-        impl_file.write_text(impl_content)
+        _materialize(project_root, {
+            "orchestration": {},
+            "src": {"auth.py": AUTH_PY},
+        })
 
         tracker = RequirementsTracker(project_root)
         implementations = tracker.scan_implementation(project_root)
@@ -157,27 +227,14 @@ def send_email():
 
 def test_scan_tests():
     """Test test scanning."""
-    with tempfile.TemporaryDirectory() as tmpdir:
+    with _test_dir() as tmpdir:
         project_root = Path(tmpdir)
-        (project_root / "orchestration").mkdir()
 
         # Create test file
-        test_content = """
-# @validates: REQ-001
-def test_login():
-    assert True
-
-# Tests REQ-002
-def test_password():
-    assert True
-
-def test_req_003_feature():
-    assert True
-"""
-        test_dir = project_root / "tests"
-        test_dir.mkdir()
-        test_file = test_dir / "test_auth.py"
-        test_file.write_text(test_content)
+        _materialize(project_root, {
+            "orchestration": {},
+            "tests": {"test_auth.py": TEST_AUTH_PY},
+        })
 
         tracker = RequirementsTracker(project_root)
         tests = tracker.scan_tests(project_root)
@@ -191,7 +248,7 @@ def test_req_003_feature():
 
 def test_traceability_matrix():
     """Test traceability matrix generation."""
-    with tempfile.TemporaryDirectory() as tmpdir:
+    with _test_dir() as tmpdir:
         project_root = Path(tmpdir)
         (project_root / "orchestration").mkdir()
 
@@ -243,7 +300,7 @@ def test_traceability_matrix():
 
 def test_database_persistence():
     """Test database save/load."""
-    with tempfile.TemporaryDirectory() as tmpdir:
+    with _test_dir() as tmpdir:
         project_root = Path(tmpdir)
         (project_root / "orchestration").mkdir()
 
@@ -269,7 +326,7 @@ def test_database_persistence():
 
 def test_category_inference():
     """Test category inference."""
-    with tempfile.TemporaryDirectory() as tmpdir:
+    with _test_dir() as tmpdir:
         project_root = Path(tmpdir)
         (project_root / "orchestration").mkdir()
 
@@ -285,7 +342,7 @@ def test_category_inference():
 
 def test_coverage_by_category():
     """Test coverage calculation by category."""
-    with tempfile.TemporaryDirectory() as tmpdir:
+    with _test_dir() as tmpdir:
         project_root = Path(tmpdir)
         (project_root / "orchestration").mkdir()
 
@@ -333,6 +390,16 @@ def test_coverage_by_category():
 
         print("✓ test_coverage_by_category")
 
+def _run_test(test):
+    """Run one test in a worker process. Returns (name, error or None)."""
+    try:
+        test()
+        return test.__name__, None
+    except AssertionError as e:
+        return test.__name__, str(e)
+    except Exception as e:
+        return test.__name__, f"Unexpected error: {e}"
+
 def run_all_tests():
     """Run all tests."""
     print("\n=== Running Requirements Tracker Tests ===\n")
@@ -352,15 +419,16 @@ def run_all_tests():
     passed = 0
     failed = 0
 
-    for test in tests:
-        try:
-            test()
+    # Each test owns its temp directory, so they can run in parallel
+    with tempfile.TemporaryDirectory(dir=TMP_BASE) as tmp_root:
+        with ProcessPoolExecutor(initializer=_init_worker, initargs=(tmp_root,)) as executor:
+            results = list(executor.map(_run_test, tests))
+
+    for name, error in results:
+        if error is None:
             passed += 1
-        except AssertionError as e:
-            print(f"✗ {test.__name__}: {e}")
-            failed += 1
-        except Exception as e:
-            print(f"✗ {test.__name__}: Unexpected error: {e}")
+        else:
+            print(f"✗ {name}: {error}")
             failed += 1
 
     print(f"\n=== Test Results ===")
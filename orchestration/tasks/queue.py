@@ -274,7 +274,7 @@ class TaskQueue:
         """Load queue state from disk."""
         if self.state_file.exists():
             try:
-                data = json.loads(self.state_file.read_text())
+                data = json.loads(self.state_file.read_bytes())
                 for task_data in data.get("tasks", []):
                     task_data["status"] = TaskStatus(task_data["status"])
                     # Handle missing fields for backward compatibility
@@ -394,7 +394,7 @@ class TaskQueue:
             "last_updated": datetime.now().isoformat()
         }
         self.state_file.parent.mkdir(parents=True, exist_ok=True)
-        self.state_file.write_text(json.dumps(data, indent=2))
+        self.state_file.write_bytes(json.dumps(data, indent=2).encode())
 
     def add_task(self, task: Task):
         """Add task to queue."""
@@ -14,6 +14,11 @@ import json
 import re
 import sys
 
+# Add parent to path for standalone script execution
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
+
+from orchestration.core.serialization import yaml_loader
+
 
 @dataclass
 class EnforcementViolation:
@@ -60,6 +65,15 @@ class ContractCompliance:
 class ContractEnforcer:
     """Enforces contract-first development."""
 
+    # Path template parameters, e.g. {id} in /users/{id}
+    PATH_PARAM_RE = re.compile(r'\{[^}]+\}')
+    PATH_PARAM_NAME_RE = re.compile(r'\{(\w+)\}')
+
+    # Source code files (Python, JavaScript, TypeScript, etc.), minus test
+    # files, config files, and __init__.py
+    SOURCE_EXTENSIONS = ('.py', '.js', '.ts', '.jsx', '.tsx', '.go', '.rs', '.java')
+    NON_IMPLEMENTATION_MARKERS = ('test_', '_test.', 'conftest', '__init__')
+
     def __init__(self, project_root: Path):
         self.project_root = Path(project_root)
         self.contracts_dir = self.project_root / "contracts"
@@ -119,18 +133,14 @@ class ContractEnforcer:
         if not component_path.exists():
             return False
 
-        # Look for source code files (Python, JavaScript, TypeScript, etc.)
-        source_extensions = ['.py', '.js', '.ts', '.jsx', '.tsx', '.go', '.rs', '.java']
-
-        for ext in source_extensions:
-            if any(component_path.rglob(f"*{ext}")):
-                # Check if it's not just test files or config
-                for file in component_path.rglob(f"*{ext}"):
-                    # Skip test files, config files, and __init__.py
-                    if not any(x in file.name for x in ['test_', '_test.', 'conftest', '__init__']):
-                        return True
+        # One walk of the tree, stopping at the first implementation file
+        return any(self._is_implementation_file(file.name)
+                   for file in component_path.rglob("*"))
 
-        return False
+    def _is_implementation_file(self, name: str) -> bool:
+        """Check if a file name is source code rather than a test, config or __init__.py."""
+        return (name.endswith(self.SOURCE_EXTENSIONS)
+                and not any(x in name for x in self.NON_IMPLEMENTATION_MARKERS))
 
     def verify_component_compliance(self, component_name: str) -> ContractCompliance:
         """
@@ -201,8 +211,8 @@ class ContractEnforcer:
         component_name = contract_path.stem.replace('_api', '')
 
         try:
-            with open(contract_path, 'r') as f:
-                contract = yaml.safe_load(f)
+            with open(contract_path, 'rb') as f:
+                contract = yaml.load(f, Loader=yaml_loader())
         except yaml.YAMLError as e:
             violations.append(EnforcementViolation(
                 component_name=component_name,
@@ -302,8 +312,8 @@ class ContractEnforcer:
         component_name = component_path.name
 
         try:
-            with open(contract_path, 'r') as f:
-                contract = yaml.safe_load(f)
+            with open(contract_path, 'rb') as f:
+                contract = yaml.load(f, Loader=yaml_loader())
         except:
             # Already reported in completeness check
             return violations
@@ -340,7 +350,7 @@ class ContractEnforcer:
                 path,  # /users/{id}
                 path.replace('{', '<').replace('}', '>'),  # /users/<id>
                 path.replace('{', ':').replace('}', ''),  # /users/:id
-                re.sub(r'\{[^}]+\}', r'\\w+', path),  # Regex pattern
+                self.PATH_PARAM_RE.sub(r'\\w+', path),  # Regex pattern
             ]
 
             found = False
@@ -376,8 +386,8 @@ class ContractEnforcer:
             return ""
 
         try:
-            with open(contract_path, 'r') as f:
-                contract = yaml.safe_load(f)
+            with open(contract_path, 'rb') as f:
+                contract = yaml.load(f, Loader=yaml_loader())
         except:
             return ""
 
@@ -489,7 +499,7 @@ class ContractEnforcer:
         params = []
 
         # Path parameters
-        path_params = re.findall(r'\{(\w+)\}', path)
+        path_params = self.PATH_PARAM_NAME_RE.findall(path)
         for param in path_params:
             params.append(f'{param}: str')
 
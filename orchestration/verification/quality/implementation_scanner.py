@@ -44,6 +44,9 @@ def is_stub_file(file_path: Path) -> bool:
     return indicator_count >= 2
 
 
+LOGIC_AFTER_KEYWORD_RE = re.compile(r'if|for|while|return|=', re.I)
+
+
 def has_actual_implementation(content: str, keywords: list[str]) -> bool:
     """Check if content has actual logic, not just definitions."""
     # Look for control flow, assignments, operations
@@ -52,8 +55,10 @@ def has_actual_implementation(content: str, keywords: list[str]) -> bool:
         r'for\s+.+:',
         r'while\s+.+:',
         r'return\s+.+',
-        r'\w+\s*=\s*.+',
-        r'\w+\.\w+\(',
+        # Anchored at word starts: the same matches, without retrying \w+
+        # from every offset inside long identifiers (quadratic backtracking)
+        r'\b\w+\s*=\s*.+',
+        r'\b\w+\.\w+\(',
     ]
 
     logic_count = sum(
@@ -62,8 +67,11 @@ def has_actual_implementation(content: str, keywords: list[str]) -> bool:
     )
 
     # Also check keywords appear near logic
+    # Equivalent to r'\bkw\b.*(?:if|...)' with re.S, but without the greedy .*
+    # backtracking across the whole file from every keyword occurrence
     for kw in keywords:
-        if re.search(rf'\b{kw}\b.*(?:if|for|while|return|=)', content, re.I | re.S):
+        kw_match = re.search(rf'\b{kw}\b', content, re.I)
+        if kw_match and LOGIC_AFTER_KEYWORD_RE.search(content, kw_match.end()):
             return True
 
     return logic_count > 10  # Has substantial logic
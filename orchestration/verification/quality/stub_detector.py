@@ -2,89 +2,233 @@
 """
 Detect stub/placeholder components that indicate incomplete implementation.
 """
+import os
 import re
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 
-
-def scan_for_stubs(project_dir: Path) -> list[str]:
+try:
+    # Third-party `regex` supports possessive quantifiers on every Python version
+    import regex as _regex_backend
+except ImportError:
+    _regex_backend = None
+
+# Directories never worth descending into (caches, VCS, build output)
+SKIP_DIRS = frozenset({"__pycache__", ".venv", ".git", "node_modules", "target"})
+
+# Number of candidate files above which scan_for_stubs() uses a given executor
+PARALLEL_SCAN_THRESHOLD = 256
+
+STUB_PATTERNS = [
+    r'implementation\s+pending',
+    r'TODO:\s*implement',
+    r'raise\s+NotImplementedError',
+    r'pass\s*#\s*stub',
+    r'pass\s*#\s*TODO',
+    r'unimplemented!\(\)',
+    r'todo!\(\)',
+    r'panic!\("not\s+implemented',
+    r'\.\.\.  # TODO',
+    r'return\s+None\s*#\s*placeholder',
+    r'PLACEHOLDER',
+    r'SKELETON',
+]
+
+
+def _compile_stub_re():
     """
-    Scan project for stub/placeholder code.
-    Returns list of files containing stubs.
+    Compile all stub patterns as one alternation, so each file is searched in
+    a single pass. Compiled as a bytes pattern: everything matched is ASCII, so
+    files are scanned without decoding them first.
+
+    Uses the `regex` module when installed, with possessive whitespace runs.
+    Every \\s run in STUB_PATTERNS is followed by a non-space literal, so the
+    possessive forms match exactly the same text but never backtrack.
     """
-    stub_patterns = [
-        r'implementation\s+pending',
-        r'TODO:\s*implement',
-        r'raise\s+NotImplementedError',
-        r'pass\s*#\s*stub',
-        r'pass\s*#\s*TODO',
-        r'unimplemented!\(\)',
-        r'todo!\(\)',
-        r'panic!\("not\s+implemented',
-        r'\.\.\.  # TODO',
-        r'return\s+None\s*#\s*placeholder',
-        r'PLACEHOLDER',
-        r'SKELETON',
+    if _regex_backend is None:
+        return re.compile(
+            "|".join(f"(?:{p})" for p in STUB_PATTERNS).encode(), re.IGNORECASE
+        )
+
+    possessive = [
+        p.replace(r"\s*", r"\s*+").replace(r"\s+", r"\s++") for p in STUB_PATTERNS
     ]
+    return _regex_backend.compile(
+        "|".join(f"(?:{p})" for p in possessive).encode(), _regex_backend.IGNORECASE
+    )
+
+
+STUB_RE = _compile_stub_re()
+
+# Source files larger than this are skipped (generated/vendored code)
+MAX_SCAN_BYTES = 1_000_000
+
+# Lowercase literals, at least one of which occurs in any STUB_RE match. Files
+# containing none of them cannot match, so the regex is skipped for them.
+STUB_TRIGGERS = (
+    b"pending",
+    b"todo",
+    b"notimplementederror",
+    b"stub",
+    b"unimplemented!",
+    b"panic!",
+    b"placeholder",
+    b"skeleton",
+)
+
+# Bytes of each README searched for pending-implementation phrases
+README_SCAN_LIMIT = 16 * 1024
+
+README_PENDING_PHRASES = [
+    "implementation pending",
+    "not yet implemented",
+    "skeleton only",
+    "placeholder component",
+    "stub implementation",
+]
+
+README_PENDING_RE = re.compile(
+    "|".join(re.escape(phrase) for phrase in README_PENDING_PHRASES).encode(),
+    re.IGNORECASE,
+)
+
+
+def _scandir_recursive(path):
+    """
+    Walk a directory tree once with os.scandir, yielding file DirEntry objects.
+    Skipped directories are pruned before recursion.
+    """
+    try:
+        with os.scandir(path) as it:
+            entries = list(it)
+    except OSError:
+        return
 
-    stubs_found = []
+    for entry in entries:
+        if entry.is_dir(follow_symlinks=False):
+            if entry.name not in SKIP_DIRS:
+                yield from _scandir_recursive(entry.path)
+        elif entry.is_file():
+            yield entry
 
-    # Check Python files
-    for py_file in project_dir.rglob("*.py"):
-        if "__pycache__" in str(py_file) or ".venv" in str(py_file):
-            continue
 
+def _file_has_stub(path: str) -> bool:
+    """
+    Check one source file or README for stub/placeholder markers.
+    Module-level so it can be dispatched to worker processes.
+    """
+    # Check READMEs for "implementation pending" language. Only the head is
+    # read: status notes like these sit near the top of a README.
+    if os.path.basename(path) == "README.md":
         try:
-            content = py_file.read_text()
+            with open(path, "rb") as f:
+                head = f.read(README_SCAN_LIMIT)
         except Exception:
-            continue
+            return False
+        return README_PENDING_RE.search(head) is not None
 
-        for pattern in stub_patterns:
-            if re.search(pattern, content, re.IGNORECASE):
-                stubs_found.append(str(py_file))
-                break
+    try:
+        with open(path, "rb") as f:
+            # Oversized files are generated or vendored, not hand-written stubs
+            if os.fstat(f.fileno()).st_size > MAX_SCAN_BYTES:
+                return False
+            content = f.read()
+    except Exception:
+        return False
 
-    # Check Rust files
-    for rs_file in project_dir.rglob("*.rs"):
-        if "target" in str(rs_file):
-            continue
+    # Skip binary files and minified single-line blobs
+    if b"\x00" in content[:4096]:
+        return False
+    if len(content) > 50_000 and content.count(b"\n") < 5:
+        return False
 
-        try:
-            content = rs_file.read_text()
-        except Exception:
-            continue
+    # Cheap substring prefilter before running the regex
+    lowered = content.lower()
+    if not any(trigger in lowered for trigger in STUB_TRIGGERS):
+        return False
 
-        for pattern in stub_patterns:
-            if re.search(pattern, content, re.IGNORECASE):
-                stubs_found.append(str(rs_file))
-                break
+    return STUB_RE.search(content) is not None
 
-    # Check READMEs for "implementation pending" language
-    for readme in project_dir.rglob("README.md"):
-        try:
-            content = readme.read_text()
-        except Exception:
-            continue
 
-        pending_phrases = [
-            "implementation pending",
-            "not yet implemented",
-            "skeleton only",
-            "placeholder component",
-            "stub implementation",
-        ]
+@lru_cache(maxsize=4096)
+def _cached_file_has_stub(path: str, mtime_ns: int, size: int) -> bool:
+    """_file_has_stub() memoized; mtime_ns and size are cache-key only."""
+    return _file_has_stub(path)
 
-        for phrase in pending_phrases:
-            if phrase.lower() in content.lower():
-                stubs_found.append(str(readme))
-                break
 
-    return list(set(stubs_found))  # Remove duplicates
+def _entry_has_stub(entry) -> bool:
+    """
+    Check a DirEntry, reusing the result from an earlier scan when the file's
+    mtime and size are unchanged.
+    """
+    try:
+        st = entry.stat()
+    except OSError:
+        return False
+    return _cached_file_has_stub(entry.path, st.st_mtime_ns, st.st_size)
+
+
+def _is_candidate(name: str) -> bool:
+    """Whether a file name is one the stub scan looks at."""
+    return name.endswith((".py", ".rs")) or name == "README.md"
+
+
+def has_stubs(project_dir: Path) -> bool:
+    """
+    Return True as soon as any stub/placeholder file is found.
+    Cheaper than scan_for_stubs() when only a yes/no answer is needed.
+    """
+    return any(
+        _entry_has_stub(entry)
+        for entry in _scandir_recursive(project_dir)
+        if _is_candidate(entry.name)
+    )
+
+
+def scan_for_stubs(project_dir: Path, executor=None) -> list[str]:
+    """
+    Scan project for stub/placeholder code.
+    Returns list of files containing stubs.
+
+    Pass an executor (e.g. a ProcessPoolExecutor created under a __main__
+    guard) to spread large trees over workers. Without one the scan runs
+    in-process and reuses results cached by earlier scans.
+    """
+    # Single pass over the tree; collect Python, Rust and README files
+    candidates = [
+        entry
+        for entry in _scandir_recursive(project_dir)
+        if _is_candidate(entry.name)
+    ]
+    paths = [entry.path for entry in candidates]
+
+    # Small trees aren't worth the dispatch cost. Workers don't share the
+    # result cache, so only the in-process path uses it.
+    if executor is not None and len(candidates) >= PARALLEL_SCAN_THRESHOLD:
+        flags = list(executor.map(_file_has_stub, paths, chunksize=64))
+    else:
+        flags = [_entry_has_stub(entry) for entry in candidates]
+
+    # Single walk visits each file once; no dedup needed
+    return [path for path, has_stub in zip(paths, flags) if has_stub]
 
 
 if __name__ == "__main__":
     import sys
-    target = Path(sys.argv[1]) if len(sys.argv) > 1 else Path.cwd()
-    stubs = scan_for_stubs(target)
+    args = [arg for arg in sys.argv[1:] if arg != "--check"]
+    target = Path(args[0]) if args else Path.cwd()
+
+    # --check: yes/no answer only, stop at the first stub
+    if "--check" in sys.argv[1:]:
+        if has_stubs(target):
+            print("Stubs found")
+            sys.exit(1)
+        print("No stubs found")
+        sys.exit(0)
+
+    with ProcessPoolExecutor() as executor:
+        stubs = scan_for_stubs(target, executor=executor)
 
     if stubs:
         print(f"Found {len(stubs)} stub/placeholder files:")
@@ -9,13 +9,75 @@ Key insight from failure analysis: "Tests passing ≠ Specification complete"
 """
 
 import json
+import os
 import re
 import sys
+from functools import lru_cache
 from pathlib import Path
 from dataclasses import dataclass, field
 from typing import Optional
 
 
+# Inline requirements (SHALL, MUST, WILL)
+SHALL_RE = re.compile(
+    r'(?:SHALL|MUST|WILL)\s+(?:implement|provide|support|include|have)\s+([^.]+)',
+    re.IGNORECASE
+)
+CAMEL_BOUNDARY_RE = re.compile(r'(?<!^)(?=[A-Z])')
+WHITESPACE_RE = re.compile(r'\s+')
+
+# Directories never searched for implementations or tests
+SKIP_DIRS = frozenset({'__pycache__', '.git'})
+
+# Headers too generic to count as features
+GENERIC_HEADERS = frozenset({'overview', 'introduction', 'summary', 'notes'})
+
+
+def _iter_files(root, prefix: str = '', suffix: str = ''):
+    """
+    Yield paths of files under root whose names match prefix/suffix.
+
+    Uses os.scandir, pruning SKIP_DIRS; a directory's own files are yielded
+    before its subdirectories are descended into. Symlinked files are
+    yielded; symlinked directories are not descended into.
+    """
+    try:
+        with os.scandir(root) as it:
+            entries = list(it)
+    except OSError:
+        return
+
+    subdirs = []
+    for entry in entries:
+        # Directory symlinks are never followed, so a link loop cannot recurse forever
+        if entry.is_dir(follow_symlinks=False):
+            if entry.name not in SKIP_DIRS:
+                subdirs.append(entry.path)
+        elif (entry.is_file()
+              and entry.name.startswith(prefix) and entry.name.endswith(suffix)):
+            yield Path(entry.path)
+
+    for subdir in subdirs:
+        yield from _iter_files(subdir, prefix, suffix)
+
+
+def _compile_feature_table(patterns: list) -> tuple:
+    """
+    Combine feature patterns into one alternation, tried in list order.
+
+    Returns the compiled regex and, for each pattern, the index of its wrapper
+    group in the combined regex and how many groups of its own it has.
+    """
+    compiled = [re.compile(p) for p in patterns]
+    spans = {}
+    index = 1
+    for i, pattern in enumerate(compiled):
+        spans[index] = (i, pattern.groups)
+        index += pattern.groups + 1
+    combined = re.compile('|'.join(f'({p})' for p in patterns), re.IGNORECASE)
+    return combined, spans
+
+
 @dataclass
 class Feature:
     """A feature extracted from specification."""
@@ -62,6 +124,8 @@ class SpecCompletenessVerifier:
         r'^\s*[-*]\s+`([^`]+)`\s*[-–:]\s*(.+)$',  # `function` - description
         r'^\s*[-*]\s+([A-Z][A-Z_]+)\s*[-–:]\s*(.+)$',  # CONSTANT - description
     ]
+    FEATURE_RES = [re.compile(p, re.IGNORECASE) for p in FEATURE_PATTERNS]
+    FEATURE_TABLE_RE, FEATURE_TABLE_SPANS = _compile_feature_table(FEATURE_PATTERNS)
 
     # Stub/placeholder indicators
     STUB_INDICATORS = [
@@ -99,48 +163,22 @@ class SpecCompletenessVerifier:
             print(f"❌ Specification file not found: {spec_path}")
             return False
 
-        self.spec_content = spec_file.read_text()
-        self._extract_features()
+        # Cached on (path, mtime, size) so unchanged specs are parsed once
+        path = str(spec_file)
+        st = os.stat(path)
+        self.spec_content, rows = _parse_spec(path, st.st_mtime_ns, st.st_size)
+        self.features = [
+            Feature(name=name, description=description, source_line=line)
+            for name, description, line in rows
+        ]
         return True
 
     def _extract_features(self):
         """Extract all features from specification document."""
-        self.features = []
-        lines = self.spec_content.split('\n')
-
-        for i, line in enumerate(lines, 1):
-            for pattern in self.FEATURE_PATTERNS:
-                match = re.match(pattern, line, re.IGNORECASE)
-                if match:
-                    groups = match.groups()
-                    name = groups[0].strip()
-                    description = groups[1].strip() if len(groups) > 1 else ""
-
-                    # Skip generic headers
-                    if name.lower() in ['overview', 'introduction', 'summary', 'notes']:
-                        continue
-
-                    feature = Feature(
-                        name=name,
-                        description=description,
-                        source_line=i
-                    )
-                    self.features.append(feature)
-                    break
-
-        # Also extract inline requirements (SHALL, MUST, WILL)
-        shall_pattern = r'(?:SHALL|MUST|WILL)\s+(?:implement|provide|support|include|have)\s+([^.]+)'
-        for i, line in enumerate(lines, 1):
-            matches = re.findall(shall_pattern, line, re.IGNORECASE)
-            for match in matches:
-                feature = Feature(
-                    name=match.strip()[:100],  # Truncate long matches
-                    description=f"Requirement from line {i}",
-                    source_line=i
-                )
-                # Avoid duplicates
-                if not any(f.name == feature.name for f in self.features):
-                    self.features.append(feature)
+        self.features = [
+            Feature(name=name, description=description, source_line=line)
+            for name, description, line in _extract_feature_rows(self.spec_content)
+        ]
 
     def verify_implementation(self, components_dir: str = "components") -> VerificationResult:
         """
@@ -167,16 +205,26 @@ class SpecCompletenessVerifier:
         for feature in self.features:
             self._check_feature_implementation(feature, components_path)
 
-        # Calculate results
-        implemented = sum(1 for f in self.features if f.implemented and not f.is_stub)
-        stubbed = sum(1 for f in self.features if f.is_stub)
-        tested = sum(1 for f in self.features if f.has_tests)
+        # Calculate results in a single pass over the features
+        implemented = 0
+        tested = 0
+        missing = []
+        stubs = []
+        untested = []
+        for f in self.features:
+            if f.is_stub:
+                stubs.append(f)
+            elif f.implemented:
+                implemented += 1
+            if f.has_tests:
+                tested += 1
+            if not f.implemented:
+                missing.append(f)
+            elif not f.has_tests:
+                untested.append(f)
+        stubbed = len(stubs)
         total = len(self.features)
 
-        missing = [f for f in self.features if not f.implemented]
-        stubs = [f for f in self.features if f.is_stub]
-        untested = [f for f in self.features if f.implemented and not f.has_tests]
-
         coverage = (implemented / total * 100) if total > 0 else 0.0
 
         # Determine blocking issues
@@ -212,9 +260,7 @@ class SpecCompletenessVerifier:
         search_terms = self._generate_search_terms(feature.name)
 
         # Search in Python files
-        for py_file in components_path.rglob("*.py"):
-            if "__pycache__" in str(py_file):
-                continue
+        for py_file in _iter_files(components_path, suffix=".py"):
             try:
                 content = py_file.read_text()
                 for term in search_terms:
@@ -233,7 +279,7 @@ class SpecCompletenessVerifier:
 
         # Search in Rust files
         if not feature.implemented:
-            for rs_file in components_path.rglob("*.rs"):
+            for rs_file in _iter_files(components_path, suffix=".rs"):
                 try:
                     content = rs_file.read_text()
                     for term in search_terms:
@@ -256,8 +302,8 @@ class SpecCompletenessVerifier:
         terms = [feature_name]
 
         # Convert to snake_case
-        snake = re.sub(r'(?<!^)(?=[A-Z])', '_', feature_name).lower()
-        snake = re.sub(r'\s+', '_', snake)
+        snake = CAMEL_BOUNDARY_RE.sub('_', feature_name).lower()
+        snake = WHITESPACE_RE.sub('_', snake)
         terms.append(snake)
 
         # Convert to camelCase
@@ -299,7 +345,7 @@ class SpecCompletenessVerifier:
         for test_dir in test_dirs:
             if not test_dir.exists():
                 continue
-            for test_file in test_dir.rglob("test_*.py"):
+            for test_file in _iter_files(test_dir, prefix="test_", suffix=".py"):
                 try:
                     content = test_file.read_text()
                     for term in search_terms:
@@ -385,6 +431,64 @@ class SpecCompletenessVerifier:
         print(f"✓ Checklist saved to {output_file}")
 
 
+def _extract_feature_rows(content: str) -> tuple:
+    """Extract (name, description, source_line) rows from specification text."""
+    rows = []
+    lines = content.split('\n')
+
+    requirements = []
+    feature_res = SpecCompletenessVerifier.FEATURE_RES
+    table_re = SpecCompletenessVerifier.FEATURE_TABLE_RE
+    spans = SpecCompletenessVerifier.FEATURE_TABLE_SPANS
+
+    # One pass: a single combined match per line picks the first feature
+    # pattern that applies, in FEATURE_PATTERNS order
+    for i, line in enumerate(lines, 1):
+        match = table_re.match(line)
+        if match:
+            start = match.lastindex
+            pattern_index, group_count = spans[start]
+            groups = match.groups()[start:start + group_count]
+            name = groups[0].strip()
+            description = groups[1].strip() if len(groups) > 1 else ""
+
+            # Skip generic headers, falling through to the remaining patterns
+            if name.lower() in GENERIC_HEADERS:
+                name = None
+                for pattern in feature_res[pattern_index + 1:]:
+                    match = pattern.match(line)
+                    if match:
+                        groups = match.groups()
+                        name = groups[0].strip()
+                        description = groups[1].strip() if len(groups) > 1 else ""
+                        if name.lower() not in GENERIC_HEADERS:
+                            break
+                        name = None
+
+            if name is not None:
+                rows.append((name, description, i))
+
+        # Also extract inline requirements (SHALL, MUST, WILL)
+        for req in SHALL_RE.findall(line):
+            requirements.append((req.strip()[:100], i))  # Truncate long matches
+
+    # Requirements go after all features, skipping duplicates
+    seen = {row[0] for row in rows}
+    for name, i in requirements:
+        if name not in seen:
+            seen.add(name)
+            rows.append((name, f"Requirement from line {i}", i))
+
+    return tuple(rows)
+
+
+@lru_cache(maxsize=256)
+def _parse_spec(path: str, mtime_ns: int, size: int) -> tuple:
+    """Read and parse a spec file; mtime_ns and size are cache-key only."""
+    content = Path(path).read_text()
+    return content, _extract_feature_rows(content)
+
+
 def main():
     """CLI entry point."""
     if len(sys.argv) < 3:
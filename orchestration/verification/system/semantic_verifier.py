@@ -26,6 +26,12 @@ import json
 @dataclass
 class SemanticIssue:
     """A semantic correctness issue."""
+    # Explicit slots (no per-instance __dict__); dataclass(slots=True) needs 3.10+
+    __slots__ = (
+        "file_path", "line_number", "issue_type", "severity",
+        "description", "requirement_id", "suggestion",
+    )
+
     file_path: str
     line_number: int
     issue_type: str